@@ -6,9 +6,60 @@ Converts compiled binary files to Verilog memory initialization format
 
 import sys
 import os
-import struct
+import mmap
+from array import array
+from itertools import chain
 
-def bin_to_verilog(bin_file, imem_file, dmem_file):
+# Inputs at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# Output buffer size, so large memory images are written in few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Per-word instruction memory line, filled with the address and the word's hex
+# digits; %-formatting beats str.format/f-strings here
+_IMEM_LINE = "    memory[%d] = 32'h%s;\n"
+_IMEM_FMT = _IMEM_LINE.__mod__
+
+# Lines are formatted in blocks, one % call per block instead of per word
+_IMEM_BLOCK = 64
+_IMEM_BLOCK_FMT = (_IMEM_LINE * _IMEM_BLOCK).__mod__
+
+# Data memory initializer (contents do not depend on the program)
+DMEM_TEMPLATE = """\
+// Data Memory Initialization for MinCPU
+// Generated from: {}
+
+initial begin
+    // Initialize data memory to zero
+    for (i = 0; i < MEM_SIZE; i = i + 1) begin
+        memory[i] = 32'h00000000;
+    end
+end
+"""
+
+def _word_hex(words, sep):
+    """Hex-encode words as 8-digit groups joined by sep, in one C-level pass"""
+    big_endian = array('I', words)
+    if sys.byteorder == 'little':
+        big_endian.byteswap()
+    return big_endian.tobytes().hex(sep, 4)
+
+def _imem_lines(words, base_addr):
+    """Format instruction memory assignments for words loaded at base_addr"""
+    hex_words = _word_hex(words, ' ').split()
+    full = len(words) - len(words) % _IMEM_BLOCK
+    
+    # Flatten (address, hex word) pairs and regroup them into per-block tuples
+    fields = chain.from_iterable(zip(range(base_addr, base_addr + full), hex_words))
+    lines = list(map(_IMEM_BLOCK_FMT, zip(*[fields] * (2 * _IMEM_BLOCK))))
+    
+    # Remaining words that don't fill a block
+    lines.extend(map(_IMEM_FMT, zip(range(base_addr + full, base_addr + len(words)),
+                                    hex_words[full:])))
+    return lines
+
+def bin_to_verilog(bin_file, imem_file, dmem_file, readmemh=False):
     """
     Convert binary file to Verilog memory initialization files
     
@@ -16,28 +67,62 @@ def bin_to_verilog(bin_file, imem_file, dmem_file):
         bin_file: Input binary file path
         imem_file: Output instruction memory Verilog file
         dmem_file: Output data memory Verilog file
+        readmemh: Write the program to a companion .hex file loaded with
+                  $readmemh instead of one assignment per word; the file is
+                  named without a directory, so the simulator must run from
+                  the directory that holds it
     """
     
-    if not os.path.exists(bin_file):
+    # The program hex sits next to the imem file; refuse to overwrite an output with it
+    hex_file = os.path.splitext(imem_file)[0] + '.hex'
+    if readmemh:
+        hex_path = os.path.normcase(os.path.abspath(hex_file))
+        for output in (imem_file, dmem_file):
+            if os.path.normcase(os.path.abspath(output)) == hex_path:
+                print(f"Error: Program hex file '{hex_file}' would overwrite output '{output}'")
+                return False
+    
+    # Read binary file
+    words = array('I')
+    try:
+        f = open(bin_file, 'rb')
+    except FileNotFoundError:
         print(f"Error: Binary file '{bin_file}' not found")
         return False
     
-    # Read binary file
-    with open(bin_file, 'rb') as f:
-        binary_data = f.read()
+    with f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            # Map large binaries and only copy out the unaligned tail
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                aligned = len(mm) & ~3
+                with memoryview(mm)[:aligned] as view:
+                    words.frombytes(view)
+                binary_data = mm[aligned:]
+        else:
+            binary_data = f.read()
     
     # Pad to word boundary
-    while len(binary_data) % 4 != 0:
-        binary_data += b'\x00'
+    pad = -len(binary_data) & 3
+    if pad:
+        binary_data += bytes(pad)
+    
+    # Convert to 32-bit words in one pass (binary is little-endian)
+    words.frombytes(binary_data)
+    if sys.byteorder != 'little':
+        words.byteswap()
     
-    # Convert to 32-bit words
-    words = []
-    for i in range(0, len(binary_data), 4):
-        word = struct.unpack('<I', binary_data[i:i+4])[0]  # Little-endian
-        words.append(word)
+    base_addr = 1024  # 0x1000 / 4
+    
+    # Generate program hex file for $readmemh
+    if readmemh:
+        with open(hex_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write("@{:x}\n".format(base_addr))
+            if words:
+                f.write(_word_hex(words, '\n'))
+                f.write("\n")
     
     # Generate instruction memory file
-    with open(imem_file, 'w') as f:
+    with open(imem_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
         f.write("// Instruction Memory Initialization for MinCPU\n")
         f.write("// Generated from: {}\n".format(bin_file))
         f.write("// Total words: {}\n\n".format(len(words)))
@@ -49,29 +134,23 @@ def bin_to_verilog(bin_file, imem_file, dmem_file):
         f.write("    end\n\n")
         
         f.write("    // Load program starting at address 0x1000 (word address 1024)\n")
-        base_addr = 1024  # 0x1000 / 4
-        
-        for i, word in enumerate(words):
-            addr = base_addr + i
-            f.write("    memory[{}] = 32'h{:08x};\n".format(addr, word))
+        if readmemh:
+            # Relative to the simulator's working directory, like any $readmemh path
+            f.write("    $readmemh(\"{}\", memory);\n".format(os.path.basename(hex_file)))
+        else:
+            f.writelines(_imem_lines(words, base_addr))
         
         f.write("\n    $display(\"Loaded {} instructions starting at address 0x1000\");\n".format(len(words)))
         f.write("end\n")
     
     # Generate data memory file (empty for now)
-    with open(dmem_file, 'w') as f:
-        f.write("// Data Memory Initialization for MinCPU\n")
-        f.write("// Generated from: {}\n\n".format(bin_file))
-        
-        f.write("initial begin\n")
-        f.write("    // Initialize data memory to zero\n")
-        f.write("    for (i = 0; i < MEM_SIZE; i = i + 1) begin\n")
-        f.write("        memory[i] = 32'h00000000;\n")
-        f.write("    end\n")
-        f.write("end\n")
+    with open(dmem_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(DMEM_TEMPLATE.format(bin_file))
     
     print(f"Generated Verilog memory files:")
     print(f"  Instruction memory: {imem_file} ({len(words)} words)")
+    if readmemh:
+        print(f"  Program hex: {hex_file}")
     print(f"  Data memory: {dmem_file}")
     
     return True
@@ -80,11 +159,12 @@ def analyze_binary(bin_file):
     """
     Analyze binary file and print statistics
     """
-    if not os.path.exists(bin_file):
+    try:
+        file_size = os.stat(bin_file).st_size
+    except FileNotFoundError:
         print(f"Error: Binary file '{bin_file}' not found")
         return
     
-    file_size = os.path.getsize(bin_file)
     word_count = (file_size + 3) // 4  # Round up to word boundary
     
     print(f"\nBinary Analysis:")
@@ -94,16 +174,23 @@ def analyze_binary(bin_file):
     print(f"  Memory usage: {word_count * 4} bytes")
 
 def main():
-    if len(sys.argv) != 4:
-        print("Usage: python3 bin2verilog.py <binary_file> <imem_output> <dmem_output>")
+    args = sys.argv[1:]
+    readmemh = '--readmemh' in args
+    if readmemh:
+        args.remove('--readmemh')
+    
+    if len(args) != 3:
+        print("Usage: python3 bin2verilog.py [--readmemh] <binary_file> <imem_output> <dmem_output>")
+        print("")
+        print("Options:")
+        print("  --readmemh  Write the program to <imem_output>.hex and load it with $readmemh")
+        print("              (run the simulator from the directory holding the .hex file)")
         print("")
         print("Example:")
         print("  python3 bin2verilog.py hello.bin hello_imem.v hello_dmem.v")
         sys.exit(1)
     
-    bin_file = sys.argv[1]
-    imem_file = sys.argv[2]
-    dmem_file = sys.argv[3]
+    bin_file, imem_file, dmem_file = args
     
     print("MinCPU Binary to Verilog Converter")
     print("=" * 40)
@@ -112,7 +199,7 @@ def main():
     analyze_binary(bin_file)
     
     # Convert to Verilog
-    if bin_to_verilog(bin_file, imem_file, dmem_file):
+    if bin_to_verilog(bin_file, imem_file, dmem_file, readmemh):
         print("\nConversion completed successfully!")
     else:
         print("\nConversion failed!")
@@ -7,6 +7,12 @@ Analyzes FPGA resource utilization and calculates performance metrics
 import re
 import sys
 import os
+import io
+import mmap
+import math
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple, Optional
 
 # FPGA Element Costs (in equivalent gates or relative cost units)
@@ -35,6 +41,67 @@ ELEMENT_COSTS = {
     'OBUF': 0
 }
 
+# Assumed LUT size distribution, in twentieths of the LUT count:
+# 40% LUT6, 25% LUT4, 20% LUT5, 10% LUT3, 5% LUT2
+_LUT_DISTRIBUTION = tuple((element, share, ELEMENT_COSTS[element]) for element, share in
+                          (('LUT6', 8), ('LUT4', 5), ('LUT5', 4), ('LUT3', 2), ('LUT2', 1)))
+
+# Element type (and its unit cost) charged for each other resource type;
+# DSPs don't have direct cost in our table
+_RESOURCE_ELEMENTS = {resource: (element, ELEMENT_COSTS[element]) for resource, element in
+                      (('LUTRAM', 'RAMD32'), ('FF', 'FDRE'), ('CARRY4', 'CARRY4'),
+                       ('BRAM', 'RAMB36E1'))}
+
+# Report separators
+_BAR = "=" * 80
+_BAR_LINE = _BAR + "\n"
+_HR_LINE = "-" * 40 + "\n"
+
+# Performance context tiers: ascending thresholds and one label per interval
+# (fmax and FoM rate a value by the highest threshold it reaches, CPI by the
+# lowest threshold it stays within)
+_FMAX_THRESHOLDS = (50, 100)
+_FMAX_LABELS = (
+    "[MODERATE] Conservative design (<50 MHz)",
+    "[GOOD] Medium-performance design (50-100 MHz)",
+    "[EXCELLENT] High-performance design (>=100 MHz)",
+)
+_CPI_THRESHOLDS = (1.1, 1.5)
+_CPI_LABELS = (
+    "[EXCELLENT] Excellent CPI (<=1.1)",
+    "[GOOD] Good CPI (1.1-1.5)",
+    "[MODERATE] High CPI (>1.5)",
+)
+_FOM_THRESHOLDS = (500, 1000)
+_FOM_LABELS = (
+    "[MODERATE] Moderate Figure of Merit (<500)",
+    "[GOOD] Good Figure of Merit (500-1000)",
+    "[EXCELLENT] Excellent Figure of Merit (>=1000)",
+)
+
+# Utilization table row for each resource type: its keyword, then the leading
+# integer of the "Used" column (fractional BRAM counts truncate). Bytes, since
+# reports are scanned straight from a memory map; the literal prefix lets each
+# search skip through the mapping at C speed.
+_UTIL_PATTERNS = {resource: re.compile(re.escape(keyword) + rb'\s*\|\s*(\d+)') for resource, keyword in
+                  (('LUT', b'LUT as Logic'), ('LUTRAM', b'LUT as Memory'),
+                   ('FF', b'Register as Flip Flop'), ('CARRY4', b'CARRY4'),
+                   ('BRAM', b'Block RAM Tile'), ('DSP', b'DSPs'))}
+
+# Timing report patterns, compiled once at import
+# Summary row: Clock    Target    Achieved    WNS ... (target and achieved are unsigned)
+_SUMMARY_ROW_RE = re.compile(rb'sys_clk\s+([\d.]+)\s+([\d.]+)\s+([-\d.]+)', re.IGNORECASE)
+_ALT_TIMING_PATTERNS = {
+    'wns': re.compile(rb'Worst Negative Slack.*?:\s*([-\d.]+)\s*ns', re.IGNORECASE),
+    'target_period': re.compile(rb'Target Period.*?:\s*([\d.]+)\s*ns', re.IGNORECASE),
+    'setup_slack': re.compile(rb'Setup.*?Slack.*?:\s*([-\d.]+)\s*ns', re.IGNORECASE),
+}
+_LEGACY_TIMING_RE = re.compile(rb'Requirement:\s*([\d.]+)ns.*Achieved:\s*([\d.]+)ns')
+
+# Benchmark log results (logs are read as text)
+_CPI_RE = re.compile(r'CPI:\s*([\d.]+)')
+_MIPS_RE = re.compile(r'MIPS.*:\s*([\d.]+)')
+
 class MinCPUAnalyzer:
     def __init__(self):
         self.utilization_data = {}
@@ -45,29 +112,18 @@ class MinCPUAnalyzer:
         """Parse Vivado utilization report to extract resource usage"""
         utilization = {}
         
-        if not os.path.exists(report_file):
-            print(f"Warning: Utilization report {report_file} not found")
-            return self._estimate_utilization()
-            
         try:
-            with open(report_file, 'r') as f:
-                content = f.read()
-                
-            # Parse different resource types
-            patterns = {
-                'LUT': r'LUT as Logic\s*\|\s*(\d+)',
-                'LUTRAM': r'LUT as Memory\s*\|\s*(\d+)',
-                'FF': r'Register as Flip Flop\s*\|\s*(\d+)',
-                'CARRY4': r'CARRY4\s*\|\s*(\d+)',
-                'BRAM': r'Block RAM Tile\s*\|\s*(\d+)',
-                'DSP': r'DSPs\s*\|\s*(\d+)'
-            }
-            
-            for resource, pattern in patterns.items():
-                match = re.search(pattern, content)
-                if match:
-                    utilization[resource] = int(match.group(1))
+            with open(report_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        for resource, pattern in _UTIL_PATTERNS.items():
+                            match = pattern.search(mm)
+                            if match:
+                                utilization[resource] = int(match.group(1))
                     
+        except FileNotFoundError:
+            print(f"Warning: Utilization report {report_file} not found")
+            return self._estimate_utilization()
         except Exception as e:
             print(f"Error parsing utilization report: {e}")
             return self._estimate_utilization()
@@ -87,28 +143,18 @@ class MinCPUAnalyzer:
     
     def parse_timing_report(self, report_file: str) -> Dict[str, float]:
         """Parse Vivado timing report to extract frequency data using WNS analysis"""
-        timing = {}
-        
-        if not os.path.exists(report_file):
+        try:
+            with open(report_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        timing = self._parse_timing_content(mm)
+                else:
+                    timing = self._parse_timing_content(b'')
+                
+        except FileNotFoundError:
             print(f"Warning: Timing report {report_file} not found")
             print("Using estimated frequency based on design complexity...")
             return {'fmax': 85.0, 'critical_path': 11.76, 'wns': -1.76, 'target_period': 10.0, 'method': 'estimated'}
-            
-        try:
-            with open(report_file, 'r') as f:
-                content = f.read()
-                
-            # Parse Vivado timing summary report for WNS and target period
-            timing_data = self._parse_vivado_timing_summary(content)
-            
-            if timing_data:
-                timing.update(timing_data)
-                timing['method'] = 'vivado_report'
-            else:
-                # Fallback to legacy parsing
-                timing = self._parse_legacy_timing_format(content)
-                timing['method'] = 'legacy_format'
-                
         except Exception as e:
             print(f"Error parsing timing report: {e}")
             # Conservative estimate for complex RISC-V design
@@ -116,35 +162,37 @@ class MinCPUAnalyzer:
             
         return timing
     
-    def _parse_vivado_timing_summary(self, content: str) -> Optional[Dict[str, float]]:
+    def _parse_timing_content(self, content: bytes) -> Dict[str, float]:
+        """Parse timing report contents, trying the Vivado summary first"""
+        # Parse Vivado timing summary report for WNS and target period
+        timing = self._parse_vivado_timing_summary(content)
+        
+        if timing:
+            timing['method'] = 'vivado_report'
+        else:
+            # Fallback to legacy parsing
+            timing = self._parse_legacy_timing_format(content)
+            timing['method'] = 'legacy_format'
+            
+        return timing
+    
+    def _parse_vivado_timing_summary(self, content: bytes) -> Optional[Dict[str, float]]:
         """Parse Vivado timing summary report format"""
         timing = {}
         
         # Look for timing summary table
         # Format: Clock    Target    Achieved    WNS    TNS    TNS Failing Endpoints
-        patterns = {
-            'wns': r'sys_clk\s+[\d.]+\s+[\d.]+\s+([-\d.]+)',  # WNS column
-            'target_period': r'sys_clk\s+([\d.]+)',  # Target period
-            'achieved_period': r'sys_clk\s+[\d.]+\s+([\d.]+)',  # Achieved period
-        }
-        
-        # Alternative patterns for different report formats
-        alt_patterns = {
-            'wns': r'Worst Negative Slack.*?:\s*([-\d.]+)\s*ns',
-            'target_period': r'Target Period.*?:\s*([\d.]+)\s*ns',
-            'setup_slack': r'Setup.*?Slack.*?:\s*([-\d.]+)\s*ns',
-        }
+        columns = ('target_period', 'achieved_period', 'wns')
         
-        # Try main patterns first
-        for key, pattern in patterns.items():
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                timing[key] = float(match.group(1))
+        # Try the summary table first: one scan for the first complete sys_clk row
+        match = _SUMMARY_ROW_RE.search(content)
+        if match:
+            timing.update(zip(columns, map(float, match.groups())))
         
         # Try alternative patterns if main ones fail
         if not timing:
-            for key, pattern in alt_patterns.items():
-                match = re.search(pattern, content, re.IGNORECASE)
+            for key, pattern in _ALT_TIMING_PATTERNS.items():
+                match = pattern.search(content)
                 if match:
                     timing[key] = float(match.group(1))
         
@@ -156,6 +204,8 @@ class MinCPUAnalyzer:
             # FMAX (MHz) = max(1000/(Ti - WNSi))
             # Note: WNS is typically negative, so Ti - WNSi = Ti - (-|WNS|) = Ti + |WNS|
             actual_period = target_period - wns  # WNS is negative slack
+            if actual_period <= 0:
+                return None
             timing['fmax'] = 1000.0 / actual_period
             timing['critical_path'] = actual_period
             
@@ -169,13 +219,12 @@ class MinCPUAnalyzer:
         
         return None
     
-    def _parse_legacy_timing_format(self, content: str) -> Dict[str, float]:
+    def _parse_legacy_timing_format(self, content: bytes) -> Dict[str, float]:
         """Parse legacy timing report formats"""
         timing = {}
         
         # Legacy format patterns
-        freq_pattern = r'Requirement:\s*([\d.]+)ns.*Achieved:\s*([\d.]+)ns'
-        match = re.search(freq_pattern, content)
+        match = _LEGACY_TIMING_RE.search(content)
         if match:
             req_period = float(match.group(1))
             achieved_period = float(match.group(2))
@@ -201,28 +250,29 @@ class MinCPUAnalyzer:
         total_mips = 0
         valid_benchmarks = 0
         
-        for log_file in log_files:
-            if os.path.exists(log_file):
-                try:
-                    with open(log_file, 'r') as f:
-                        content = f.read()
-                    
-                    # Extract CPI
-                    cpi_match = re.search(r'CPI:\s*([\d.]+)', content)
-                    if cpi_match:
-                        cpi = float(cpi_match.group(1))
-                        if cpi < best_cpi and cpi > 0:
-                            best_cpi = cpi
-                    
-                    # Extract MIPS
-                    mips_match = re.search(r'MIPS.*:\s*([\d.]+)', content)
-                    if mips_match:
-                        mips = float(mips_match.group(1))
-                        total_mips += mips
-                        valid_benchmarks += 1
-                        
-                except Exception as e:
-                    print(f"Error parsing {log_file}: {e}")
+        # Logs are independent, so read them concurrently; results are
+        # collected in list order so output stays deterministic
+        futures = []
+        if log_files:
+            with ThreadPoolExecutor(max_workers=min(8, len(log_files))) as executor:
+                futures = [executor.submit(self._parse_log_file, log_file) for log_file in log_files]
+        
+        for log_file, future in zip(log_files, futures):
+            try:
+                cpi, mips = future.result()
+            except Exception as e:
+                print(f"Error parsing {log_file}: {e}")
+                continue
+                
+            # Keep the best CPI
+            if cpi is not None:
+                if cpi < best_cpi and cpi > 0:
+                    best_cpi = cpi
+            
+            # Accumulate MIPS for the average
+            if mips is not None:
+                total_mips += mips
+                valid_benchmarks += 1
         
         if best_cpi != float('inf'):
             performance['cpi'] = best_cpi
@@ -232,47 +282,62 @@ class MinCPUAnalyzer:
             
         return performance
     
+    def _parse_log_file(self, log_file: str) -> Tuple[Optional[float], Optional[float]]:
+        """Extract (CPI, MIPS) from one benchmark log; missing values are None"""
+        cpi = mips = None
+        
+        try:
+            f = open(log_file, 'r')
+        except FileNotFoundError:
+            return cpi, mips
+        
+        # Stream the log, stopping once both results have been seen. Lines without
+        # a label only pay for a substring test. A line holding a label is carried
+        # forward (with any blank lines after it) and searched together with the
+        # next line, so a value printed on the line after its label is still found.
+        with f:
+            carry = ''
+            for line in f:
+                if carry:
+                    window = carry + line
+                elif 'CPI:' in line or 'MIPS' in line:
+                    window = line
+                else:
+                    continue
+                if cpi is None:
+                    match = _CPI_RE.search(window)
+                    if match:
+                        cpi = float(match.group(1))
+                if mips is None:
+                    match = _MIPS_RE.search(window)
+                    if match:
+                        mips = float(match.group(1))
+                if cpi is not None and mips is not None:
+                    break
+                if line.isspace():
+                    carry = window
+                else:
+                    carry = line if 'CPI:' in line or 'MIPS' in line else ''
+                    
+        return cpi, mips
+    
     def calculate_cost(self, utilization: Dict[str, int]) -> float:
         """Calculate total cost based on FPGA resource utilization"""
         total_cost = 0
         cost_breakdown = {}
         
-        # Map utilization to specific element types
-        element_mapping = {
-            'LUT': ['LUT6', 'LUT4', 'LUT5', 'LUT3', 'LUT2', 'LUT1'],
-            'LUTRAM': ['RAMD32', 'RAMS32'],
-            'FF': ['FDRE', 'FDSE', 'FDCE'],
-            'CARRY4': ['CARRY4'],
-            'BRAM': ['RAMB36E1'],
-            'DSP': []  # DSPs don't have direct cost in our table
-        }
-        
+        # Map utilization to specific element types using the precomputed tables
         for resource, count in utilization.items():
-            if resource in element_mapping:
-                elements = element_mapping[resource]
-                if elements:
-                    # Distribute count across element types (simplified)
-                    if resource == 'LUT':
-                        # Assume distribution: 40% LUT6, 25% LUT4, 20% LUT5, 15% others
-                        cost_breakdown['LUT6'] = int(count * 0.4)
-                        cost_breakdown['LUT4'] = int(count * 0.25)
-                        cost_breakdown['LUT5'] = int(count * 0.2)
-                        cost_breakdown['LUT3'] = int(count * 0.1)
-                        cost_breakdown['LUT2'] = int(count * 0.05)
-                    elif resource == 'LUTRAM':
-                        cost_breakdown['RAMD32'] = count
-                    elif resource == 'FF':
-                        cost_breakdown['FDRE'] = count
-                    elif resource == 'CARRY4':
-                        cost_breakdown['CARRY4'] = count
-                    elif resource == 'BRAM':
-                        cost_breakdown['RAMB36E1'] = count
-        
-        # Calculate total cost
-        for element, count in cost_breakdown.items():
-            if element in ELEMENT_COSTS:
-                element_cost = ELEMENT_COSTS[element] * count
-                total_cost += element_cost
+            if resource == 'LUT':
+                # Distribute count across LUT sizes (simplified)
+                for element, share, unit_cost in _LUT_DISTRIBUTION:
+                    element_count = count * share // 20
+                    cost_breakdown[element] = element_count
+                    total_cost += unit_cost * element_count
+            elif resource in _RESOURCE_ELEMENTS:
+                element, unit_cost = _RESOURCE_ELEMENTS[resource]
+                cost_breakdown[element] = count
+                total_cost += unit_cost * count
                 
         return total_cost, cost_breakdown
     
@@ -283,6 +348,10 @@ class MinCPUAnalyzer:
         if cpi <= 0 or cost <= 0:
             return 0.0
             
+        # Fast path for the default weights: no general pow() calls
+        if fmax_weight == 1.0 and cpi_weight == 1.0 and cost_weight == 0.5:
+            return 1000.0 * fmax / cpi / math.sqrt(cost)
+            
         fom = (1000.0 * (fmax ** fmax_weight)) / (cpi ** cpi_weight) / (cost ** cost_weight)
         return fom
     
@@ -309,105 +378,79 @@ class MinCPUAnalyzer:
         fom = self.calculate_figure_of_merit(timing['fmax'], performance['cpi'], total_cost)
         
         # Generate report
-        report = []
-        report.append("=" * 80)
-        report.append("MinCPU COMPREHENSIVE ANALYSIS REPORT")
-        report.append("=" * 80)
-        report.append("")
+        report = io.StringIO()
+        write = report.write
+        write(_BAR_LINE + "MinCPU COMPREHENSIVE ANALYSIS REPORT\n" + _BAR_LINE + "\n")
         
         # Timing Analysis
-        report.append("TIMING ANALYSIS:")
-        report.append("-" * 40)
-        report.append(f"Maximum Frequency: {timing['fmax']:.1f} MHz")
-        report.append(f"Critical Path: {timing.get('critical_path', 25.0):.1f} ns")
+        write("TIMING ANALYSIS:\n" + _HR_LINE)
+        write(f"Maximum Frequency: {timing['fmax']:.1f} MHz\n")
+        write(f"Critical Path: {timing.get('critical_path', 25.0):.1f} ns\n")
         
         # Show timing analysis details if available
         if 'target_period' in timing and 'wns' in timing:
-            report.append(f"Target Period: {timing['target_period']:.1f} ns")
-            report.append(f"Worst Negative Slack: {timing['wns']:.2f} ns")
-            report.append(f"Timing Method: {timing.get('method', 'unknown')}")
+            write(f"Target Period: {timing['target_period']:.1f} ns\n")
+            write(f"Worst Negative Slack: {timing['wns']:.2f} ns\n")
+            write(f"Timing Method: {timing.get('method', 'unknown')}\n")
             if timing['wns'] >= 0:
-                report.append("Timing Status: [PASS] Timing constraints met")
+                write("Timing Status: [PASS] Timing constraints met\n")
             else:
-                report.append(f"Timing Status: [FAIL] Timing violation ({abs(timing['wns']):.2f} ns)")
+                write(f"Timing Status: [FAIL] Timing violation ({abs(timing['wns']):.2f} ns)\n")
         else:
-            report.append(f"Clock Period: {1000.0/timing['fmax']:.1f} ns")
-            report.append(f"Timing Method: {timing.get('method', 'estimated')}")
+            write(f"Clock Period: {1000.0/timing['fmax']:.1f} ns\n")
+            write(f"Timing Method: {timing.get('method', 'estimated')}\n")
         
-        report.append("")
+        write("\n")
         
         # Performance Analysis
-        report.append("PERFORMANCE ANALYSIS:")
-        report.append("-" * 40)
-        report.append(f"Best CPI: {performance['cpi']:.2f}")
-        report.append(f"Average MIPS: {performance['mips']:.1f}")
-        report.append(f"Peak Performance: {timing['fmax']/performance['cpi']:.1f} MIPS")
-        report.append("")
+        write("PERFORMANCE ANALYSIS:\n" + _HR_LINE)
+        write(f"Best CPI: {performance['cpi']:.2f}\n")
+        write(f"Average MIPS: {performance['mips']:.1f}\n")
+        write(f"Peak Performance: {timing['fmax']/performance['cpi']:.1f} MIPS\n")
+        write("\n")
         
         # Resource Utilization
-        report.append("RESOURCE UTILIZATION:")
-        report.append("-" * 40)
+        write("RESOURCE UTILIZATION:\n" + _HR_LINE)
         for resource, count in utilization.items():
-            report.append(f"{resource:12}: {count:6d}")
-        report.append("")
+            write(f"{resource:12}: {count:6d}\n")
+        write("\n")
         
         # Cost Analysis
-        report.append("COST ANALYSIS:")
-        report.append("-" * 40)
-        report.append("Element Breakdown:")
+        write("COST ANALYSIS:\n" + _HR_LINE)
+        write("Element Breakdown:\n")
         for element, count in cost_breakdown.items():
             if count > 0:
                 element_cost = ELEMENT_COSTS[element] * count
-                report.append(f"  {element:12}: {count:4d} × {ELEMENT_COSTS[element]:4d} = {element_cost:8d}")
-        report.append(f"{'':30} Total Cost: {total_cost:8.0f}")
-        report.append("")
+                write(f"  {element:12}: {count:4d} × {ELEMENT_COSTS[element]:4d} = {element_cost:8d}\n")
+        write(f"{'':30} Total Cost: {total_cost:8.0f}\n")
+        write("\n")
         
         # Figure of Merit
-        report.append("FIGURE OF MERIT:")
-        report.append("-" * 40)
-        report.append(f"FoM = (1000 × fmax^1.0) / (cpi^1.0) / (cost^0.5)")
-        report.append(f"FoM = (1000 × {timing['fmax']:.1f}) / {performance['cpi']:.2f} / {total_cost:.0f}^0.5")
-        report.append(f"FoM = {fom:.2f}")
-        report.append("")
+        write("FIGURE OF MERIT:\n" + _HR_LINE)
+        write(f"FoM = (1000 × fmax^1.0) / (cpi^1.0) / (cost^0.5)\n")
+        write(f"FoM = (1000 × {timing['fmax']:.1f}) / {performance['cpi']:.2f} / {total_cost:.0f}^0.5\n")
+        write(f"FoM = {fom:.2f}\n")
+        write("\n")
         
         # Performance Density Metrics
         mips_per_cost = performance['mips'] / (total_cost ** 0.5) if total_cost > 0 else 0
         freq_per_cost = timing['fmax'] / (total_cost ** 0.5) if total_cost > 0 else 0
         
-        report.append("EFFICIENCY METRICS:")
-        report.append("-" * 40)
-        report.append(f"MIPS per Cost^0.5: {mips_per_cost:.2f}")
-        report.append(f"MHz per Cost^0.5: {freq_per_cost:.2f}")
-        report.append(f"Performance Density: {fom:.2f} FoM")
-        report.append("")
+        write("EFFICIENCY METRICS:\n" + _HR_LINE)
+        write(f"MIPS per Cost^0.5: {mips_per_cost:.2f}\n")
+        write(f"MHz per Cost^0.5: {freq_per_cost:.2f}\n")
+        write(f"Performance Density: {fom:.2f} FoM\n")
+        write("\n")
         
         # Comparison Context
-        report.append("PERFORMANCE CONTEXT:")
-        report.append("-" * 40)
-        if timing['fmax'] >= 100:
-            report.append("[EXCELLENT] High-performance design (>=100 MHz)")
-        elif timing['fmax'] >= 50:
-            report.append("[GOOD] Medium-performance design (50-100 MHz)")
-        else:
-            report.append("[MODERATE] Conservative design (<50 MHz)")
-            
-        if performance['cpi'] <= 1.1:
-            report.append("[EXCELLENT] Excellent CPI (<=1.1)")
-        elif performance['cpi'] <= 1.5:
-            report.append("[GOOD] Good CPI (1.1-1.5)")
-        else:
-            report.append("[MODERATE] High CPI (>1.5)")
-            
-        if fom >= 1000:
-            report.append("[EXCELLENT] Excellent Figure of Merit (>=1000)")
-        elif fom >= 500:
-            report.append("[GOOD] Good Figure of Merit (500-1000)")
-        else:
-            report.append("[MODERATE] Moderate Figure of Merit (<500)")
+        write("PERFORMANCE CONTEXT:\n" + _HR_LINE)
+        write(_FMAX_LABELS[bisect_right(_FMAX_THRESHOLDS, timing['fmax'])] + "\n")
+        write(_CPI_LABELS[bisect_left(_CPI_THRESHOLDS, performance['cpi'])] + "\n")
+        write(_FOM_LABELS[bisect_right(_FOM_THRESHOLDS, fom)] + "\n")
         
-        report.append("=" * 80)
+        write(_BAR)
         
-        return "\n".join(report)
+        return report.getvalue()
 
 def main():
     """Main function for command-line usage"""
@@ -424,11 +467,11 @@ def main():
     
     # Generate and print report
     report = analyzer.generate_report(utilization_file, timing_file)
-    print(report)
+    sys.stdout.write(report)
+    sys.stdout.write("\n")
     
     # Save report to file
-    with open("cost_analysis_report.txt", "w", encoding='utf-8') as f:
-        f.write(report)
+    Path("cost_analysis_report.txt").write_text(report, encoding='utf-8')
     
     print(f"\nReport saved to: cost_analysis_report.txt")
 
@@ -7,9 +7,40 @@ Analyzes Verilog modules to estimate maximum operating frequency
 import re
 import os
 import sys
-from typing import Dict, List, Tuple
+import mmap
+import operator
+from collections import deque
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# Report separators
+_BAR_LINE = "=" * 60 + "\n"
+_HR_LINE = "-" * 40 + "\n"
+
+# Patterns are bytes: Verilog files are scanned straight from a memory map
+
+# Module definitions: name and full text up to endmodule
+_MODULE_RE = re.compile(rb'module\s+(\w+).*?endmodule', re.DOTALL)
+
+# Operation classes counted for the generic delay estimate. Their character
+# sets are disjoint, so a single alternation scan counts each one exactly as
+# a separate findall would; m.lastindex identifies the class that matched.
+_OPERATION_RE = re.compile(rb'(?P<arithmetic>[+\-])|(?P<logical>[&|^~])|'
+                           rb'(?P<comparisons>[<>=!]+)|(?P<multiplexers>\?|\bcase\b)')
+
+# Case statements in the control unit's decode logic
+_CASE_RE = re.compile(rb'\bcase\b')
+
+# Below this many uncached files, process start-up outweighs parallel analysis
+_PARALLEL_MIN_FILES = 4
 
 class TimingAnalyzer:
+    __slots__ = ('gate_delays', 'pipeline_nodes', 'pipeline_edges', 'module_paths',
+                 'critical_paths', '_file_cache', '_module_dispatch', '_alu_critical',
+                 '_decode_delay', '_lut4_delay', '_ram_access_delay', '_regfile_delay',
+                 '_generic_weights')
+    
     def __init__(self):
         # Typical gate delays (in picoseconds) for modern FPGA
         self.gate_delays = {
@@ -29,152 +60,249 @@ class TimingAnalyzer:
             'route': 100     # Routing delay per hop
         }
         
+        # Delay constants derived once from gate_delays for the per-module estimators
+        d = self.gate_delays
+        # ALU worst case: 32-bit ripple add/sub plus the output-select mux (logical
+        # ops, the 5-stage shifter and compare are all shorter)
+        self._alu_critical = 32 * d['add1'] + 31 * d['carry'] + d['mux8']
+        self._decode_delay = d['lut6'] * 2  # Two levels of LUTs
+        self._lut4_delay = d['lut4']
+        self._ram_access_delay = d['ram_access']
+        self._regfile_delay = d['ram_access'] // 2  # Distributed RAM is faster
+        # Per-operation weights in _OPERATION_RE group order
+        self._generic_weights = (d['add1'], d['and2'], d['lut4'], d['mux4'])
+        
+        # Pipeline timing graph. Each node is a component on a timing path and
+        # takes the estimated delay of its module (or the default, in ps, when
+        # the module isn't found); path endpoints have no module.
+        self.pipeline_nodes = {
+            'fetch': ('instruction_memory', 2000),
+            'decode_imm': ('immediate_gen', 500),
+            'decode_ctrl': ('control_unit', 800),
+            'regfile_read': ('register_file', 1000),
+            'alu': ('alu', 3500),
+            'mem_access': ('data_memory', 2000),
+            'branch_cmp': ('branch_unit', 600),
+            'branch_imm': ('immediate_gen', 500),
+            'branch_target': ('alu', 3500),
+            'IF_path': (None, 0),
+            'EX_ALU_path': (None, 0),
+            'MEM_path': (None, 0),
+            'BRANCH_path': (None, 0)
+        }
+        
+        # Connections between components as (from, to, routing delay in ps)
+        self.pipeline_edges = [
+            # Path 1: Instruction fetch and decode
+            ('fetch', 'decode_imm', 0),
+            ('decode_imm', 'decode_ctrl', 0),
+            ('decode_ctrl', 'IF_path', 200),
+            
+            # Path 2: Execute stage (ALU path)
+            ('regfile_read', 'alu', 0),
+            ('alu', 'EX_ALU_path', 150),
+            
+            # Path 3: Memory access (ALU computes the address)
+            ('alu', 'mem_access', 0),
+            ('mem_access', 'MEM_path', 200),
+            
+            # Path 4: Branch/jump calculation (ALU computes the target)
+            ('regfile_read', 'branch_cmp', 0),
+            ('branch_cmp', 'branch_imm', 0),
+            ('branch_imm', 'branch_target', 0),
+            ('branch_target', 'BRANCH_path', 150)
+        ]
+        
         self.module_paths = {}
         self.critical_paths = []
+        
+        # analyze_file results keyed by (filename, mtime)
+        self._file_cache = {}
+        
+        # Module-specific delay estimators, looked up by module name
+        self._module_dispatch = {
+            'alu': self.estimate_alu_delay,
+            'control_unit': self.estimate_control_delay,
+            'register_file': self.estimate_regfile_delay
+        }
+        # Known memory modules resolve here instead of by substring test
+        for name in ('instruction_memory', 'data_memory', 'memory_interface',
+                     'memory_byte_enable', 'memory_load_unit'):
+            self._module_dispatch[name] = self.estimate_memory_delay
+    
+    def _verilog_files(self, modules_dir: str) -> List[Tuple[str, float]]:
+        """List (path, mtime) for each Verilog file in a directory"""
+        with os.scandir(modules_dir) as entries:
+            return [(entry.path, entry.stat().st_mtime) for entry in entries
+                    if entry.name.endswith('.v') and entry.is_file()]
     
-    def analyze_file(self, filename: str) -> Dict[str, int]:
+    def analyze_file(self, filename: str, mtime: Optional[float] = None) -> Dict[str, int]:
         """Analyze a Verilog file and estimate delays for each module"""
         delays = {}
         
-        if not os.path.exists(filename):
+        # The modification time is passed in when the caller already has it
+        try:
+            key = (filename, os.path.getmtime(filename) if mtime is None else mtime)
+        except OSError:
             return delays
-            
-        with open(filename, 'r') as f:
-            content = f.read()
-        
-        # Extract module definitions
-        modules = re.findall(r'module\s+(\w+).*?endmodule', content, re.DOTALL)
         
-        for module_match in re.finditer(r'module\s+(\w+).*?endmodule', content, re.DOTALL):
-            module_name = module_match.group(1)
-            module_content = module_match.group(0)
-            delay = self.estimate_module_delay(module_name, module_content)
-            delays[module_name] = delay
+        # Reuse the result if the file hasn't changed since it was analyzed
+        if key in self._file_cache:
+            return self._file_cache[key]
+            
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # Extract module definitions
+                    for module_match in _MODULE_RE.finditer(content):
+                        module_name = module_match.group(1).decode('ascii')
+                        module_content = module_match.group(0)
+                        delay = self.estimate_module_delay(module_name, module_content)
+                        delays[module_name] = delay
             
+        self._file_cache[key] = delays
         return delays
     
-    def estimate_module_delay(self, module_name: str, content: str) -> int:
+    def _analyze_files(self, verilog_files: List[Tuple[str, float]]) -> List[Dict[str, int]]:
+        """Analyze (path, mtime) pairs, in parallel when enough files need scanning"""
+        pending = [item for item in verilog_files if item not in self._file_cache]
+        if len(pending) >= _PARALLEL_MIN_FILES:
+            # Workers build a fresh instance of this analyzer's class, so
+            # subclass estimators apply however many files are scanned
+            try:
+                with ProcessPoolExecutor() as executor:
+                    results = executor.map(_analyze_file_worker, repeat(type(self)), pending)
+                    for item, delays in zip(pending, results):
+                        self._file_cache[item] = delays
+            except Exception:
+                # Any pool failure (no sem_open, a dead worker, an unpicklable
+                # call): the serial path below fills in whatever is missing
+                pass
+        
+        return [self.analyze_file(vfile, mtime) for vfile, mtime in verilog_files]
+    
+    def estimate_module_delay(self, module_name: str, content: bytes) -> int:
         """Estimate the critical path delay through a module"""
-        delay = 0
-        
-        # Count different types of operations
-        operations = {
-            'arithmetic': len(re.findall(r'[+\-]', content)),
-            'logical': len(re.findall(r'[&|^~]', content)),
-            'shifts': len(re.findall(r'<<|>>', content)),
-            'comparisons': len(re.findall(r'[<>=!]+', content)),
-            'multiplexers': len(re.findall(r'\?|\bcase\b', content)),
-            'assignments': len(re.findall(r'<=|=', content))
-        }
-        
         # Estimate delays based on module type
-        if module_name == 'alu':
-            delay = self.estimate_alu_delay(content)
-        elif module_name == 'control_unit':
-            delay = self.estimate_control_delay(content)
-        elif module_name == 'register_file':
-            delay = self.estimate_regfile_delay(content)
-        elif 'memory' in module_name:
-            delay = self.gate_delays['ram_access']
-        else:
-            # Generic estimation based on operations
-            delay = (operations['arithmetic'] * self.gate_delays['add1'] +
-                    operations['logical'] * self.gate_delays['and2'] +
-                    operations['multiplexers'] * self.gate_delays['mux4'] +
-                    operations['comparisons'] * self.gate_delays['lut4'])
-        
-        return delay
+        estimator = self._module_dispatch.get(module_name)
+        if estimator is not None:
+            return estimator(content)
+        if 'memory' in module_name:
+            return self.estimate_memory_delay(content)
+        
+        # Count different types of operations in one pass
+        counts = [0] * 4
+        for match in _OPERATION_RE.finditer(content):
+            counts[match.lastindex - 1] += 1
+        
+        # Generic estimation based on operations
+        return sum(map(operator.mul, counts, self._generic_weights))
     
-    def estimate_alu_delay(self, content: str) -> int:
+    def estimate_alu_delay(self, content: bytes) -> int:
         """Estimate ALU critical path delay"""
-        # ALU has multiple operations, find worst case
-        delays = {
-            'add_sub': 32 * self.gate_delays['add1'] + 31 * self.gate_delays['carry'],  # 32-bit adder
-            'logical': self.gate_delays['lut4'],  # Single LUT for logical ops
-            'shift': 5 * self.gate_delays['mux2'],  # 5-stage barrel shifter
-            'compare': self.gate_delays['add1'] * 32 + self.gate_delays['lut4'],  # Subtract + compare
-            'mux_select': self.gate_delays['mux8']  # Output selection
-        }
-        
-        # Worst case: addition + output mux
-        critical_delay = delays['add_sub'] + delays['mux_select']
-        return critical_delay
+        # Worst case (addition + output mux) only depends on gate delays
+        return self._alu_critical
     
-    def estimate_control_delay(self, content: str) -> int:
+    def estimate_memory_delay(self, content: bytes) -> int:
+        """Estimate memory module delay"""
+        # Memories are modeled as a block RAM access
+        return self._ram_access_delay
+    
+    def estimate_control_delay(self, content: bytes) -> int:
         """Estimate control unit delay"""
         # Control unit is mostly combinational logic
         # Count case statements and logical operations
-        case_count = len(re.findall(r'\bcase\b', content))
-        
-        # Instruction decode: opcode -> control signals
-        decode_delay = self.gate_delays['lut6'] * 2  # Two levels of LUTs
+        case_count = len(_CASE_RE.findall(content))
         
-        # Control signal generation
-        control_delay = case_count * self.gate_delays['lut4']
-        
-        return decode_delay + control_delay
+        # Instruction decode (opcode -> control signals) plus control signal generation
+        return self._decode_delay + case_count * self._lut4_delay
     
-    def estimate_regfile_delay(self, content: str) -> int:
+    def estimate_regfile_delay(self, content: bytes) -> int:
         """Estimate register file delay"""
-        # Register file read is typically one Block RAM access
-        return self.gate_delays['ram_access'] // 2  # Distributed RAM is faster
+        # Register file read is typically one Block RAM access; distributed RAM is faster
+        return self._regfile_delay
     
-    def analyze_critical_paths(self, modules_dir: str = '.') -> List[Tuple[str, int]]:
-        """Analyze critical paths through the entire design"""
-        verilog_files = [f for f in os.listdir(modules_dir) if f.endswith('.v')]
-        all_delays = {}
-        
-        for vfile in verilog_files:
-            file_delays = self.analyze_file(os.path.join(modules_dir, vfile))
-            all_delays.update(file_delays)
-        
-        # Define critical paths through the pipeline
-        critical_paths = [
-            # Path 1: Instruction fetch and decode
-            ('IF_path', [
-                ('instruction_memory', all_delays.get('instruction_memory', 2000)),
-                ('immediate_gen', all_delays.get('immediate_gen', 500)),
-                ('control_unit', all_delays.get('control_unit', 800)),
-                ('routing', 200)
-            ]),
+    def analyze_critical_paths(self, modules_dir: str = '.',
+                               all_delays: Optional[Dict[str, int]] = None,
+                               out: Optional[List[str]] = None) -> Tuple[str, int]:
+        """Analyze critical paths through the entire design; returns the worst path and its delay"""
+        # Report lines go to the caller's buffer, or are written out here when standalone
+        standalone = out is None
+        if standalone:
+            out = []
+        emit = out.append
+        
+        # Reuse module delays already collected by the caller, else scan modules_dir
+        if all_delays is None:
+            all_delays = {}
             
-            # Path 2: Execute stage (ALU path)
-            ('EX_ALU_path', [
-                ('register_file', all_delays.get('register_file', 1000)),
-                ('alu', all_delays.get('alu', 3500)),
-                ('routing', 150)
-            ]),
+            for file_delays in self._analyze_files(self._verilog_files(modules_dir)):
+                all_delays.update(file_delays)
+        
+        # Node delays, then one topological pass for each node's latest finish time
+        node_delays = {node: all_delays.get(module, default) if module else default
+                       for node, (module, default) in self.pipeline_nodes.items()}
+        finish, critical_pred, worst_path = self._propagate_arrival_times(node_delays)
+        
+        # Report each path endpoint along its critical chain of components
+        for path_name, (module, _) in self.pipeline_nodes.items():
+            if module is not None:
+                continue
             
-            # Path 3: Memory access
-            ('MEM_path', [
-                ('register_file', all_delays.get('register_file', 1000)),
-                ('alu', all_delays.get('alu', 3500)),  # Address calculation
-                ('data_memory', all_delays.get('data_memory', 2000)),
-                ('routing', 200)
-            ]),
+            components = []
+            routing = 0
+            node = path_name
+            while node in critical_pred:
+                node, edge_delay = critical_pred[node]
+                components.append((self.pipeline_nodes[node][0], node_delays[node]))
+                routing += edge_delay
+            components.reverse()
+            components.append(('routing', routing))
             
-            # Path 4: Branch/jump calculation
-            ('BRANCH_path', [
-                ('register_file', all_delays.get('register_file', 1000)),
-                ('branch_unit', all_delays.get('branch_unit', 600)),
-                ('immediate_gen', all_delays.get('immediate_gen', 500)),
-                ('alu', all_delays.get('alu', 3500)),  # Address calculation
-                ('routing', 150)
-            ])
-        ]
-        
-        # Calculate total delay for each path
-        path_delays = []
-        for path_name, components in critical_paths:
-            total_delay = sum(delay for _, delay in components)
-            path_delays.append((path_name, total_delay))
+            total_delay = finish[path_name]
             
-            print(f"\n{path_name}:")
+            emit(f"\n{path_name}:\n")
             for comp_name, comp_delay in components:
-                print(f"  {comp_name:20s}: {comp_delay:6d} ps")
-            print(f"  {'Total':20s}: {total_delay:6d} ps")
+                emit(f"  {comp_name:20s}: {comp_delay:6d} ps\n")
+            emit(f"  {'Total':20s}: {total_delay:6d} ps\n")
         
-        return path_delays
+        if standalone:
+            sys.stdout.write(''.join(out))
+        
+        return worst_path, finish[worst_path]
+    
+    def _propagate_arrival_times(self, node_delays: Dict[str, int]) -> Tuple[Dict[str, int], Dict[str, Tuple[str, int]], str]:
+        """Compute finish times in topological order (Kahn), plus the last path endpoint to finish"""
+        successors = {node: [] for node in self.pipeline_nodes}
+        indegree = dict.fromkeys(self.pipeline_nodes, 0)
+        for src, dst, edge_delay in self.pipeline_edges:
+            successors[src].append((dst, edge_delay))
+            indegree[dst] += 1
+        
+        start = dict.fromkeys(self.pipeline_nodes, 0)
+        finish = {}
+        critical_pred = {}  # node -> (predecessor, edge delay) on its latest arrival
+        worst_path, worst_delay = None, -1
+        
+        ready = deque(node for node, count in indegree.items() if count == 0)
+        while ready:
+            node = ready.popleft()
+            finish[node] = start[node] + node_delays[node]
+            if self.pipeline_nodes[node][0] is None and finish[node] > worst_delay:
+                worst_path, worst_delay = node, finish[node]
+            for succ, edge_delay in successors[node]:
+                arrival = finish[node] + edge_delay
+                if succ not in critical_pred or arrival > start[succ]:
+                    start[succ] = arrival
+                    critical_pred[succ] = (node, edge_delay)
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    ready.append(succ)
+        
+        if len(finish) != len(self.pipeline_nodes):
+            raise ValueError("Pipeline timing graph contains a cycle")
+        
+        return finish, critical_pred, worst_path
     
     def calculate_max_frequency(self, critical_delay_ps: int) -> float:
         """Calculate maximum frequency given critical path delay"""
@@ -192,106 +320,125 @@ class TimingAnalyzer:
     
     def generate_timing_report(self, modules_dir: str = '.'):
         """Generate comprehensive timing analysis report"""
-        print("=" * 60)
-        print("MinCPU Critical Path Timing Analysis")
-        print("=" * 60)
+        # Buffer the whole report and write it to stdout in one call
+        out = []
+        emit = out.append
+        
+        emit(_BAR_LINE)
+        emit("MinCPU Critical Path Timing Analysis\n")
+        emit(_BAR_LINE)
         
         # Analyze individual modules
-        verilog_files = [f for f in os.listdir(modules_dir) if f.endswith('.v')]
+        verilog_files = self._verilog_files(modules_dir)
         all_delays = {}
         
-        print("\nModule Delay Analysis:")
-        print("-" * 40)
+        emit("\nModule Delay Analysis:\n")
+        emit(_HR_LINE)
         
-        for vfile in verilog_files:
-            file_delays = self.analyze_file(os.path.join(modules_dir, vfile))
+        for file_delays in self._analyze_files(verilog_files):
             all_delays.update(file_delays)
             
             for module, delay in file_delays.items():
-                print(f"{module:20s}: {delay:6d} ps ({delay/1000:.2f} ns)")
+                emit(f"{module:20s}: {delay:6d} ps ({delay/1000:.2f} ns)\n")
         
         # Analyze critical paths
-        print("\nCritical Path Analysis:")
-        print("-" * 40)
+        emit("\nCritical Path Analysis:\n")
+        emit(_HR_LINE)
         
-        path_delays = self.analyze_critical_paths(modules_dir)
+        worst_path, worst_delay = self.analyze_critical_paths(modules_dir, all_delays, out)
         
-        # Find worst case
-        worst_path, worst_delay = max(path_delays, key=lambda x: x[1])
-        
-        print(f"\nWorst Case Critical Path: {worst_path}")
-        print(f"Critical Path Delay: {worst_delay} ps ({worst_delay/1000:.2f} ns)")
+        emit(f"\nWorst Case Critical Path: {worst_path}\n")
+        emit(f"Critical Path Delay: {worst_delay} ps ({worst_delay/1000:.2f} ns)\n")
         
         # Calculate maximum frequency
         max_freq = self.calculate_max_frequency(worst_delay)
         
-        print(f"\nFrequency Analysis:")
-        print("-" * 40)
-        print(f"Setup Time:        {self.gate_delays['ff_setup']:6d} ps")
-        print(f"Safety Margin:     {500:6d} ps")
-        print(f"Total Cycle Time:  {worst_delay + self.gate_delays['ff_setup'] + 500:6d} ps")
-        print(f"Maximum Frequency: {max_freq:6.1f} MHz")
+        emit(f"\nFrequency Analysis:\n")
+        emit(_HR_LINE)
+        emit(f"Setup Time:        {self.gate_delays['ff_setup']:6d} ps\n")
+        emit(f"Safety Margin:     {500:6d} ps\n")
+        emit(f"Total Cycle Time:  {worst_delay + self.gate_delays['ff_setup'] + 500:6d} ps\n")
+        emit(f"Maximum Frequency: {max_freq:6.1f} MHz\n")
         
         # Performance projections
-        print(f"\nPerformance Projections:")
-        print("-" * 40)
+        emit(f"\nPerformance Projections:\n")
+        emit(_HR_LINE)
         cpi_estimates = [1.2, 1.5, 2.0]  # Different CPI scenarios
         
         for cpi in cpi_estimates:
             mips = max_freq / cpi
-            print(f"CPI {cpi:.1f}:  {mips:6.1f} MIPS @ {max_freq:.1f} MHz")
+            emit(f"CPI {cpi:.1f}:  {mips:6.1f} MIPS @ {max_freq:.1f} MHz\n")
         
         # Area estimation
-        self.estimate_area()
+        self.estimate_area(out)
+        
+        sys.stdout.write(''.join(out))
         
         return max_freq, worst_delay
     
-    def estimate_area(self):
+    def estimate_area(self, out: Optional[List[str]] = None):
         """Estimate FPGA resource usage"""
-        print(f"\nArea Estimation (Xilinx 7-series):")
-        print("-" * 40)
-        
-        # Rough estimates based on module complexity
-        area_estimates = {
-            'ALU': {'LUTs': 250, 'FFs': 0, 'DSP': 0},
-            'Register File': {'LUTs': 200, 'FFs': 1024, 'DSP': 0},
-            'Control Unit': {'LUTs': 150, 'FFs': 10, 'DSP': 0},
-            'Pipeline Regs': {'LUTs': 50, 'FFs': 128, 'DSP': 0},
-            'PC Logic': {'LUTs': 100, 'FFs': 32, 'DSP': 0},
-            'Immediate Gen': {'LUTs': 80, 'FFs': 0, 'DSP': 0},
-            'Branch Unit': {'LUTs': 50, 'FFs': 0, 'DSP': 0},
-            'Memory Interface': {'LUTs': 100, 'FFs': 20, 'DSP': 0},
-            'Debug Logic': {'LUTs': 70, 'FFs': 64, 'DSP': 0}
-        }
+        # Report lines go to the caller's buffer, or are written out here when standalone
+        standalone = out is None
+        if standalone:
+            out = []
+        emit = out.append
+        
+        emit(f"\nArea Estimation (Xilinx 7-series):\n")
+        emit(_HR_LINE)
+        
+        # Rough estimates based on module complexity: (component, LUTs, FFs, DSP)
+        area_estimates = [
+            ('ALU', 250, 0, 0),
+            ('Register File', 200, 1024, 0),
+            ('Control Unit', 150, 10, 0),
+            ('Pipeline Regs', 50, 128, 0),
+            ('PC Logic', 100, 32, 0),
+            ('Immediate Gen', 80, 0, 0),
+            ('Branch Unit', 50, 0, 0),
+            ('Memory Interface', 100, 20, 0),
+            ('Debug Logic', 70, 64, 0)
+        ]
         
-        total_luts = sum(est['LUTs'] for est in area_estimates.values())
-        total_ffs = sum(est['FFs'] for est in area_estimates.values())
+        total_luts = total_ffs = total_dsp = 0
         total_bram = 2  # Instruction and data memory
         
-        print(f"{'Component':15s} | {'LUTs':5s} | {'FFs':5s} | {'DSP':3s}")
-        print("-" * 40)
-        
-        for comp, resources in area_estimates.items():
-            print(f"{comp:15s} | {resources['LUTs']:5d} | {resources['FFs']:5d} | {resources['DSP']:3d}")
-        
-        print("-" * 40)
-        print(f"{'TOTAL':15s} | {total_luts:5d} | {total_ffs:5d} | {0:3d}")
-        print(f"Block RAMs: {total_bram}")
+        emit(f"{'Component':15s} | {'LUTs':5s} | {'FFs':5s} | {'DSP':3s}\n")
+        emit(_HR_LINE)
+        
+        # Print each component and accumulate the totals in the same pass
+        for comp, luts, ffs, dsp in area_estimates:
+            emit(f"{comp:15s} | {luts:5d} | {ffs:5d} | {dsp:3d}\n")
+            total_luts += luts
+            total_ffs += ffs
+            total_dsp += dsp
+        
+        emit(_HR_LINE)
+        emit(f"{'TOTAL':15s} | {total_luts:5d} | {total_ffs:5d} | {total_dsp:3d}\n")
+        emit(f"Block RAMs: {total_bram}\n")
+        
+        # Compare to typical FPGA sizes: (device, LUTs, FFs, BRAM)
+        fpga_sizes = [
+            ('XC7A35T', 20800, 41600, 50),
+            ('XC7A50T', 32600, 65200, 150),
+            ('XC7A100T', 63400, 126800, 135)
+        ]
         
-        # Compare to typical FPGA sizes
-        fpga_sizes = {
-            'XC7A35T': {'LUTs': 20800, 'FFs': 41600, 'BRAM': 50},
-            'XC7A50T': {'LUTs': 32600, 'FFs': 65200, 'BRAM': 150},
-            'XC7A100T': {'LUTs': 63400, 'FFs': 126800, 'BRAM': 135}
-        }
+        emit(f"\nFPGA Utilization:\n")
+        emit(_HR_LINE)
+        for fpga, luts, ffs, bram in fpga_sizes:
+            lut_util = (total_luts / luts) * 100
+            ff_util = (total_ffs / ffs) * 100
+            bram_util = (total_bram / bram) * 100
+            emit(f"{fpga}: LUT {lut_util:4.1f}% | FF {ff_util:4.1f}% | BRAM {bram_util:4.1f}%\n")
         
-        print(f"\nFPGA Utilization:")
-        print("-" * 40)
-        for fpga, resources in fpga_sizes.items():
-            lut_util = (total_luts / resources['LUTs']) * 100
-            ff_util = (total_ffs / resources['FFs']) * 100
-            bram_util = (total_bram / resources['BRAM']) * 100
-            print(f"{fpga}: LUT {lut_util:4.1f}% | FF {ff_util:4.1f}% | BRAM {bram_util:4.1f}%")
+        if standalone:
+            sys.stdout.write(''.join(out))
+
+def _analyze_file_worker(analyzer_cls: type, item: Tuple[str, float]) -> Dict[str, int]:
+    """Process-pool entry point: analyze one (path, mtime) with a fresh analyzer_cls"""
+    filename, mtime = item
+    return analyzer_cls().analyze_file(filename, mtime)
 
 def main():
     analyzer = TimingAnalyzer()
@@ -6,12 +6,19 @@ Uploads compiled C programs to the MinCPU via UART bootloader interface
 
 import sys
 import os
+import io
 import time
+import select
 import serial
 import struct
+import zlib
 import argparse
 
 class MinCPUUARTLoader:
+    # Little-endian protocol word and magic/size/address header packers
+    _U32 = struct.Struct('<I')
+    _HDR = struct.Struct('<III')
+    
     def __init__(self, port, baud_rate=115200, timeout=5):
         """
         Initialize UART loader
@@ -25,6 +32,7 @@ class MinCPUUARTLoader:
         self.baud_rate = baud_rate
         self.timeout = timeout
         self.serial_port = None
+        self._fd = None
         
         # Protocol constants
         self.MAGIC_WORD = 0xDEADBEEF
@@ -43,77 +51,128 @@ class MinCPUUARTLoader:
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout
             )
+            self._fd = self._selectable_fd()
             print(f"Connected to {self.port} at {self.baud_rate} baud")
             return True
         except serial.SerialException as e:
             print(f"Error connecting to {self.port}: {e}")
             return False
     
+    def _selectable_fd(self):
+        """File descriptor for select(), or None where ports have none (e.g. Windows)"""
+        if os.name != 'posix' or not hasattr(self.serial_port, 'fileno'):
+            return None
+        try:
+            return self.serial_port.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            return None
+    
     def disconnect(self):
         """Disconnect from the serial port"""
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
             print("Disconnected from serial port")
     
-    def send_bytes(self, data):
-        """Send bytes to the serial port"""
+    def _ensure_connected(self):
+        """Raise if the serial port is not open"""
         if not self.serial_port or not self.serial_port.is_open:
             raise Exception("Serial port not connected")
+    
+    def send_bytes(self, data):
+        """Send bytes to the serial port"""
+        self._ensure_connected()
         
         self.serial_port.write(data)
         self.serial_port.flush()
     
-    def receive_byte(self):
-        """Receive a single byte from the serial port"""
-        if not self.serial_port or not self.serial_port.is_open:
-            raise Exception("Serial port not connected")
+    def _recv(self, n):
+        """Receive exactly n bytes, waiting for readiness with select()"""
+        self._ensure_connected()
         
-        data = self.serial_port.read(1)
-        if len(data) == 0:
-            raise Exception("Timeout waiting for response")
+        if self._fd is None:
+            data = self.serial_port.read(n)
+            if len(data) < n:
+                raise TimeoutError("Timeout waiting for response")
+            return data
         
-        return data[0]
+        # A timeout of None blocks until data arrives, as pyserial's read() does
+        buf = bytearray()
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while len(buf) < n:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                raise TimeoutError("Timeout waiting for response")
+            chunk = os.read(self._fd, n - len(buf))
+            if not chunk:
+                raise Exception("Serial port closed")
+            buf += chunk
+        return bytes(buf)
+    
+    def receive_byte(self):
+        """Receive a single byte from the serial port"""
+        return self._recv(1)[0]
     
     def send_magic_word(self):
         """Send the magic word to initiate bootloader"""
         print("Sending magic word...")
-        magic_bytes = struct.pack('<I', self.MAGIC_WORD)  # Little-endian
+        magic_bytes = self._U32.pack(self.MAGIC_WORD)
         self.send_bytes(magic_bytes)
         time.sleep(0.1)  # Allow bootloader to process
     
     def send_program_size(self, size):
         """Send the program size"""
         print(f"Sending program size: {size} bytes")
-        size_bytes = struct.pack('<I', size)  # Little-endian
+        size_bytes = self._U32.pack(size)
         self.send_bytes(size_bytes)
         time.sleep(0.1)
     
     def send_load_address(self, address):
         """Send the load address"""
         print(f"Sending load address: 0x{address:08x}")
-        addr_bytes = struct.pack('<I', address)  # Little-endian
+        addr_bytes = self._U32.pack(address)
         self.send_bytes(addr_bytes)
         time.sleep(0.1)
     
+    def _send_header(self, size, address):
+        """Send magic word, program size and load address in one write"""
+        print(f"Sending header: size {size} bytes, load address 0x{address:08x}")
+        header = self._HDR.pack(self.MAGIC_WORD, size, address)
+        self.send_bytes(header)
+    
     def send_program_data(self, data):
         """Send the program data"""
         print(f"Sending program data ({len(data)} bytes)...")
+        self._ensure_connected()
         
-        # Send data in chunks to avoid overwhelming the bootloader
+        # Queue chunks into the OS write buffer for progress reporting;
+        # pacing is left to the driver and drained once at the end
         chunk_size = 64
-        for i in range(0, len(data), chunk_size):
-            chunk = data[i:i+chunk_size]
-            self.send_bytes(chunk)
+        view = memoryview(data)
+        total = len(view)
+        report_step = max(total // 100, chunk_size)  # ~100 progress updates
+        next_report = 0
+        for i in range(0, total, chunk_size):
+            chunk = view[i:i+chunk_size]
+            self.serial_port.write(chunk)
             
             # Progress indication
-            progress = (i + len(chunk)) / len(data) * 100
-            print(f"\rProgress: {progress:.1f}%", end='', flush=True)
-            
-            # Small delay between chunks
-            time.sleep(0.01)
+            sent = i + len(chunk)
+            if sent >= next_report or sent == total:
+                progress = sent / total * 100
+                print(f"\rProgress: {progress:.1f}%", end='', flush=True)
+                next_report = sent + report_step
         
+        self.serial_port.flush()
         print()  # New line after progress
     
+    def send_checksum(self, data):
+        """Send the CRC-32 of the program data"""
+        crc = zlib.crc32(data)
+        print(f"Sending checksum: 0x{crc:08x}")
+        crc_bytes = self._U32.pack(crc)
+        self.send_bytes(crc_bytes)
+    
     def wait_for_response(self):
         """Wait for bootloader response"""
         print("Waiting for bootloader response...")
@@ -137,20 +196,25 @@ class MinCPUUARTLoader:
         if not os.path.exists(filename):
             raise FileNotFoundError(f"Binary file '{filename}' not found")
         
+        # Read into a bytearray with room for word padding so that
+        # upload_program can align the buffer in place
+        data = bytearray(os.path.getsize(filename) + 3)
         with open(filename, 'rb') as f:
-            data = f.read()
+            size = f.readinto(data)
+        del data[size:]
         
         print(f"Loaded binary file: {filename}")
-        print(f"  Size: {len(data)} bytes")
+        print(f"  Size: {size} bytes")
         return data
     
-    def upload_program(self, binary_file, load_address=None):
+    def upload_program(self, binary_file, load_address=None, checksum=False):
         """
         Upload a program to MinCPU via UART bootloader
         
         Args:
             binary_file: Path to the binary file
             load_address: Memory address to load the program (default: 0x1000)
+            checksum: Append a CRC-32 trailer for bootloaders that verify it
         
         Returns:
             True if successful, False otherwise
@@ -162,9 +226,10 @@ class MinCPUUARTLoader:
             # Load the binary file
             program_data = self.load_binary_file(binary_file)
             
-            # Pad to word boundary
-            while len(program_data) % 4 != 0:
-                program_data += b'\x00'
+            # Pad to word boundary (already aligned in the common case)
+            pad = -len(program_data) & 3
+            if pad:
+                program_data += b'\x00' * pad
             
             print(f"\nStarting upload to MinCPU...")
             print(f"  File: {binary_file}")
@@ -173,10 +238,10 @@ class MinCPUUARTLoader:
             print()
             
             # Send bootloader protocol sequence
-            self.send_magic_word()
-            self.send_program_size(len(program_data))
-            self.send_load_address(load_address)
+            self._send_header(len(program_data), load_address)
             self.send_program_data(program_data)
+            if checksum:
+                self.send_checksum(program_data)
             
             # Wait for response
             success = self.wait_for_response()
@@ -200,11 +265,10 @@ class MinCPUUARTLoader:
             # Try to send some data and see if we get echo or response
             test_data = b'AT\r\n'
             self.send_bytes(test_data)
-            time.sleep(0.5)
             
-            # Check if there's any response
+            # Check if there's any response; returns as soon as a line arrives
             self.serial_port.timeout = 1
-            response = self.serial_port.read(100)
+            response = self.serial_port.read_until(b'\n', 100)
             self.serial_port.timeout = self.timeout
             
             if len(response) > 0:
@@ -226,6 +290,8 @@ def main():
     parser.add_argument('-a', '--address', type=lambda x: int(x, 0), default=0x1000, 
                         help='Load address (default: 0x1000)')
     parser.add_argument('-t', '--test', action='store_true', help='Test connection only')
+    parser.add_argument('--crc', action='store_true',
+                        help='Append a CRC-32 of the program after the data')
     parser.add_argument('--timeout', type=float, default=5, help='Communication timeout (seconds)')
     
     args = parser.parse_args()
@@ -247,7 +313,7 @@ def main():
                 sys.exit(1)
         else:
             # Upload the program
-            if not loader.upload_program(args.binary_file, args.address):
+            if not loader.upload_program(args.binary_file, args.address, args.crc):
                 sys.exit(1)
         
     except KeyboardInterrupt: